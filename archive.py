@@ -0,0 +1,70 @@
+import argparse
+import time
+import mysql.connector
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+
+# Table -> (primary key, condition selecting closed rows older than the horizon)
+ARCHIVE_TABLES = {
+    "Rental": (
+        "Rental_ID",
+        "Return_Date < DATE_SUB(CURDATE(), INTERVAL %s DAY) AND Damage_Report IS NOT NULL",
+    ),
+    "Reservation": (
+        "Reservation_ID",
+        "Return_Status = 'Returned' AND Date < DATE_SUB(CURDATE(), INTERVAL %s DAY)",
+    ),
+}
+
+def archive_table(connection, table, horizon_days, batch_size, pause):
+    """Move closed rows of a table into its archive table in small batches"""
+    id_column, closed_condition = ARCHIVE_TABLES[table]
+    cursor = connection.cursor()
+    moved = 0
+
+    while True:
+        cursor.execute(f"""
+            SELECT {id_column} FROM {table}
+            WHERE {closed_condition}
+            ORDER BY {id_column}
+            LIMIT %s
+        """, (horizon_days, batch_size))
+        ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            break
+
+        # Copy and delete the batch in one transaction so rows are never lost or duplicated
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(f"INSERT INTO {table}_Archive SELECT * FROM {table} WHERE {id_column} IN ({placeholders})", ids)
+        cursor.execute(f"DELETE FROM {table} WHERE {id_column} IN ({placeholders})", ids)
+        connection.commit()
+        moved += len(ids)
+
+        # Throttle so archiving does not starve the live application
+        time.sleep(pause)
+
+    cursor.close()
+    return moved
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive closed Rental and Reservation rows")
+    parser.add_argument("--horizon-days", type=int, default=180, help="Only archive rows closed more than this many days ago")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows moved per transaction")
+    parser.add_argument("--pause", type=float, default=0.5, help="Seconds to sleep between batches")
+    parser.add_argument("--tables", nargs="+", choices=list(ARCHIVE_TABLES), default=list(ARCHIVE_TABLES))
+    args = parser.parse_args()
+
+    connection = mysql.connector.connect(
+        host=DB_HOST,
+        user="admin_user",
+        password=USER_CREDENTIALS["admin_user"],
+        database=DB_NAME
+    )
+    try:
+        for table in args.tables:
+            moved = archive_table(connection, table, args.horizon_days, args.batch_size, args.pause)
+            print(f"{table}: archived {moved} rows")
+    finally:
+        connection.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import streamlit as st
+import mysql.connector
+from mysql.connector import Error
+from datetime import datetime
+import atexit
+import collections
+import json
+import queue
+import sys
+import threading
+import time
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+
+# Bounded so a slow database cannot make the audit queue grow without limit;
+# once it is full, log() blocks for up to AUDIT_PUT_TIMEOUT, the only backpressure on callers
+AUDIT_QUEUE_SIZE = 10000
+AUDIT_PUT_TIMEOUT = 5.0  # seconds log() waits for room before setting the event aside
+AUDIT_BATCH_SIZE = 200  # events per multi-row INSERT
+AUDIT_FLUSH_INTERVAL = 1.0  # seconds the writer waits for more events
+AUDIT_MAX_BACKOFF = 10.0  # seconds between retries while the database is unavailable
+AUDIT_SHUTDOWN_RETRIES = 5  # failed writes tolerated while flushing on close
+
+# Server errors that can succeed on retry: too many connections, shutdown, lock wait timeout, deadlock.
+# Client errors (2000+, or no errno at all) are connection problems and are retried too;
+# anything else, such as a missing Audit_Log table or a value too long, will never succeed.
+AUDIT_TRANSIENT_ERRNOS = {1040, 1053, 1205, 1213}
+
+# executemany turns this into a single multi-row INSERT per batch
+INSERT_AUDIT = """
+    INSERT INTO Audit_Log (Event_Time, Actor_Type, Actor_ID, Action, Entity, Entity_ID, Before_Image, After_Image)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def fetch_row(cursor, table, key_column, key):
+    """Current image of a row as a dict, or None if it does not exist"""
+    cursor.execute(f"SELECT * FROM {table} WHERE {key_column} = %s", (key,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip([column[0] for column in cursor.description], row))
+
+def is_transient(error):
+    """Whether a failed audit write is worth retrying"""
+    errno = error.errno if error.errno is not None else -1
+    return errno < 0 or errno >= 2000 or errno in AUDIT_TRANSIENT_ERRNOS
+
+def dead_letter(events, reason):
+    """Last resort for events that cannot be written: keep them in the server log"""
+    for event in events:
+        print(f"Unwritten audit event ({reason}): {event}", file=sys.stderr)
+
+class AuditLogger:
+    """Queues audit events and writes them to Audit_Log in batches from a background thread"""
+    def __init__(self, maxsize=AUDIT_QUEUE_SIZE, batch_size=AUDIT_BATCH_SIZE, flush_interval=AUDIT_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._stop = threading.Event()
+        # Guards _stop and _producers; never held while waiting on the queue
+        self._close_lock = threading.Lock()
+        # log() calls between their closed check and the end of their put
+        self._producers = 0
+        # Batches taken off the queue but not written yet; the head is retried before anything new
+        self._pending = collections.deque()
+        self._connection = None
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, actor_type, actor_id, action, entity, entity_id, before=None, after=None):
+        """Queue one event; waits up to AUDIT_PUT_TIMEOUT while the queue is full"""
+        event = (
+            datetime.now(), actor_type, actor_id, action, entity, entity_id,
+            json.dumps(before, default=str) if before is not None else None,
+            json.dumps(after, default=str) if after is not None else None,
+        )
+        with self._close_lock:
+            if self._stop.is_set():
+                raise RuntimeError("Audit logger is closed")
+            self._producers += 1
+        try:
+            self._queue.put(event, timeout=AUDIT_PUT_TIMEOUT)
+        except queue.Full:
+            # The business write is already committed: never hang the page on the audit log
+            dead_letter([event], "audit queue full")
+        finally:
+            with self._close_lock:
+                self._producers -= 1
+
+    def close(self):
+        """Stop the writer after everything queued has been flushed"""
+        with self._close_lock:
+            if self._stop.is_set():
+                return
+            self._stop.set()
+        self._thread.join()
+        self._disconnect()
+
+    def _drained(self):
+        """Closed, no log() call still putting, and nothing left in the queue"""
+        with self._close_lock:
+            if not self._stop.is_set() or self._producers:
+                return False
+        return self._queue.empty()
+
+    def _run(self):
+        failures = 0
+        while True:
+            if not self._pending:
+                batch = self._next_batch()
+                if not batch:
+                    if self._drained():
+                        break
+                    continue
+                self._pending.append(batch)
+
+            batch = self._pending[0]
+            try:
+                written = self._write(batch)
+            except Error as e:
+                # Retrying cannot help: split the batch to isolate the bad events and set those aside
+                self._pending.popleft()
+                if len(batch) > 1:
+                    middle = len(batch) // 2
+                    self._pending.extendleft([batch[middle:], batch[:middle]])
+                else:
+                    dead_letter(batch, f"Error: '{e}'")
+                continue
+
+            if written:
+                self._pending.popleft()
+                failures = 0
+                continue
+
+            failures += 1
+            if self._stop.is_set() and failures >= AUDIT_SHUTDOWN_RETRIES:
+                self._report_unwritten()
+                break
+            # Nothing is held while backing off; callers only wait once the queue fills up
+            time.sleep(min(2 ** (failures - 1), AUDIT_MAX_BACKOFF))
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        """Insert one batch; False if it should be retried, raises Error if it never can succeed"""
+        cursor = None
+        try:
+            if self._connection is None:
+                self._connection = mysql.connector.connect(
+                    host=DB_HOST,
+                    user="admin_user",
+                    password=USER_CREDENTIALS["admin_user"],
+                    database=DB_NAME
+                )
+            cursor = self._connection.cursor()
+            cursor.executemany(INSERT_AUDIT, batch)
+            self._connection.commit()
+            cursor.close()
+            return True
+        except Error as e:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+            if not is_transient(e):
+                if self._connection is not None:
+                    try:
+                        self._connection.rollback()
+                    except Error:
+                        self._disconnect()
+                raise
+            print(f"Audit write failed, will retry: '{e}'", file=sys.stderr)
+            self._disconnect()
+            return False
+
+    def _disconnect(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Error:
+                pass
+            self._connection = None
+
+    def _report_unwritten(self):
+        """Last resort when the process exits with the database still down"""
+        events = [event for batch in self._pending for event in batch]
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        dead_letter(events, "database unavailable at shutdown")
+
+# One writer thread per server process
+@st.cache_resource
+def get_audit_logger():
+    return AuditLogger()
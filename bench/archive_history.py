@@ -0,0 +1,135 @@
+"""Hot query latency at 1x and 100x Rental/Reservation history, before and after archiving.
+
+Needs a running MySQL server with the schema from codes.sql loaded. The data is
+seeded into a separate scratch database (sports_rental_bench by default), so the
+application database is never touched.
+
+    python bench/archive_history.py --base-rows 2000 --factor 100
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+import mysql.connector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from archive import archive_table
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+from db import STATEMENTS
+
+TABLES = ["Admin", "Student", "Equipment", "Reservation", "Rental", "Reservation_Archive", "Rental_Archive"]
+
+# Hot student portal statements and the parameters they are timed with
+HOT_QUERIES = {
+    "active_rentals": lambda student_id: (student_id,),
+    "student_summary": lambda student_id: (student_id,),
+    "equipment_catalog": lambda student_id: ("All", "All", "All", "All"),
+}
+
+STUDENTS = 200
+EQUIPMENT = 50
+ACTIVE_RENTALS = 200  # open rentals, the same at every scale
+INSERT_BATCH = 5000
+
+def reset_tables(cursor, database):
+    """Recreate the scratch tables from the live schema"""
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+    for table in TABLES:
+        cursor.execute(f"DROP TABLE IF EXISTS {database}.{table}")
+        cursor.execute(f"CREATE TABLE {database}.{table} LIKE {DB_NAME}.{table}")
+    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+def insert_rows(cursor, query, rows):
+    for start in range(0, len(rows), INSERT_BATCH):
+        cursor.executemany(query, rows[start:start + INSERT_BATCH])
+
+def seed(connection, history_rows):
+    """Fill the scratch tables with a fixed active set plus history_rows closed rentals/reservations"""
+    cursor = connection.cursor()
+    today = date.today()
+    cursor.execute("INSERT INTO Admin (Admin_ID, Name) VALUES (1, 'Bench Admin')")
+    insert_rows(cursor, "INSERT INTO Student (Student_ID, Name, Email, Phone, Overdue_Items, Admin_ID) VALUES (%s, %s, %s, %s, 0, 1)",
+                [(1001 + i, f"Student {i}", f"s{i}@example.com", "000") for i in range(STUDENTS)])
+    insert_rows(cursor, "INSERT INTO Equipment (Equipment_ID, Name, Type, Status, Maintenance_Status, Admin_ID) VALUES (%s, %s, %s, 'Available', 'Good', 1)",
+                [(2001 + i, f"Item {i}", f"Type {i % 5}") for i in range(EQUIPMENT)])
+
+    rentals = []
+    reservations = []
+    for i in range(ACTIVE_RENTALS):
+        student_id, equipment_id = 1001 + i % STUDENTS, 2001 + i % EQUIPMENT
+        rentals.append((4001 + i, today, today + timedelta(days=7), None, student_id, equipment_id))
+        reservations.append((3001 + i, 7, "In Progress", today, equipment_id, student_id))
+    for i in range(history_rows):
+        student_id, equipment_id = 1001 + i % STUDENTS, 2001 + i % EQUIPMENT
+        # Closed well before the archive horizon
+        rental_date = today - timedelta(days=400 + i % 1000)
+        rentals.append((4001 + ACTIVE_RENTALS + i, rental_date, rental_date + timedelta(days=7), "None", student_id, equipment_id))
+        reservations.append((3001 + ACTIVE_RENTALS + i, 7, "Returned", rental_date, equipment_id, student_id))
+
+    insert_rows(cursor, "INSERT INTO Rental (Rental_ID, Rental_Date, Return_Date, Damage_Report, Student_ID, Equipment_ID) VALUES (%s, %s, %s, %s, %s, %s)", rentals)
+    insert_rows(cursor, "INSERT INTO Reservation (Reservation_ID, Rental_Period, Return_Status, Date, Equipment_ID, Student_ID) VALUES (%s, %s, %s, %s, %s, %s)", reservations)
+    connection.commit()
+    cursor.execute("ANALYZE TABLE Rental, Reservation")
+    cursor.fetchall()
+    cursor.close()
+
+def time_hot_queries(connection, repeat):
+    """Median milliseconds per hot statement, run through prepared cursors like the app"""
+    timings = {}
+    for name, make_params in HOT_QUERIES.items():
+        cursor = connection.cursor(prepared=True)
+        query = STATEMENTS[name]
+        samples = []
+        for i in range(repeat):
+            params = make_params(1001 + i % STUDENTS)
+            start = time.perf_counter()
+            cursor.execute(query, params)
+            cursor.fetchall()
+            samples.append((time.perf_counter() - start) * 1000)
+        cursor.close()
+        samples.sort()
+        timings[name] = samples[len(samples) // 2]
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", default="sports_rental_bench", help="Scratch database to seed")
+    parser.add_argument("--base-rows", type=int, default=2000, help="Closed history rows at 1x")
+    parser.add_argument("--factor", type=int, default=100, help="History growth factor to compare against 1x")
+    parser.add_argument("--repeat", type=int, default=200, help="Executions per statement")
+    args = parser.parse_args()
+    if args.database == DB_NAME:
+        parser.error("refusing to seed the application database")
+
+    connection = mysql.connector.connect(
+        host=DB_HOST,
+        user="admin_user",
+        password=USER_CREDENTIALS["admin_user"]
+    )
+    results = []
+    try:
+        for scale in (1, args.factor):
+            cursor = connection.cursor()
+            reset_tables(cursor, args.database)
+            cursor.close()
+            connection.database = args.database
+
+            history_rows = args.base_rows * scale
+            seed(connection, history_rows)
+            before = time_hot_queries(connection, args.repeat)
+            for table in ("Rental", "Reservation"):
+                archive_table(connection, table, horizon_days=30, batch_size=INSERT_BATCH, pause=0)
+            after = time_hot_queries(connection, args.repeat)
+            results.append((scale, history_rows, before, after))
+    finally:
+        connection.close()
+
+    print(f"{'history':>10} {'rows':>10} {'statement':<20} {'live ms':>9} {'archived ms':>12}")
+    for scale, history_rows, before, after in results:
+        for name in HOT_QUERIES:
+            print(f"{str(scale) + 'x':>10} {history_rows:>10} {name:<20} {before[name]:>9.3f} {after[name]:>12.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Throughput of each registered hot statement: prepared protocol vs text protocol.
+
+Needs a running MySQL server with codes.sql loaded. Only reads are issued, as
+student_user, against the application database.
+
+    python bench/prepared_vs_text.py --iterations 2000
+"""
+import argparse
+import os
+import sys
+import time
+import mysql.connector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+from db import STATEMENTS
+
+# Statements whose placeholders are not all student IDs
+SAMPLE_PARAMS = {
+    "equipment_catalog": ("All", "All", "All", "All"),
+}
+
+def sample_params(name, student_id):
+    return SAMPLE_PARAMS.get(name, (student_id,) * STATEMENTS[name].count("%s"))
+
+def run(cursor, query, params, iterations):
+    """Queries per second for one statement on one cursor"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cursor.execute(query, params)
+        cursor.fetchall()
+    return iterations / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="Executions per statement and protocol")
+    parser.add_argument("--student-id", type=int, default=1001)
+    args = parser.parse_args()
+
+    connection = mysql.connector.connect(
+        host=DB_HOST,
+        user="student_user",
+        password=USER_CREDENTIALS["student_user"],
+        database=DB_NAME,
+        autocommit=True
+    )
+    print(f"{'statement':<26} {'text q/s':>10} {'prepared q/s':>13} {'speedup':>8}")
+    try:
+        for name, query in STATEMENTS.items():
+            params = sample_params(name, args.student_id)
+
+            text_cursor = connection.cursor()
+            # Warm up the server caches so both protocols start from the same state
+            run(text_cursor, query, params, 10)
+            text_qps = run(text_cursor, query, params, args.iterations)
+            text_cursor.close()
+
+            # One cursor per statement, prepared once and reused, as PreparedStatementPool does
+            prepared_cursor = connection.cursor(prepared=True)
+            run(prepared_cursor, query, params, 10)
+            prepared_qps = run(prepared_cursor, query, params, args.iterations)
+            prepared_cursor.close()
+
+            print(f"{name:<26} {text_qps:>10.0f} {prepared_qps:>13.0f} {prepared_qps / text_qps:>7.2f}x")
+    finally:
+        connection.close()
+
+if __name__ == "__main__":
+    main()
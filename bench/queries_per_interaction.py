@@ -0,0 +1,158 @@
+"""Database statements per student portal interaction, st.tabs version vs lazy sections.
+
+Drives both versions of the app with streamlit's AppTest. mysql.connector.connect
+is replaced by an in-memory fake that counts every statement executed, so no
+database is needed. The st.tabs version is bench/fixtures/app_tabs.py, or any git
+revision of app.py given with --tabs-revision.
+
+    python bench/queries_per_interaction.py > bench/queries_per_interaction.txt
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+import mysql.connector
+import streamlit as st
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Snapshot of app.py from when the student portal rendered every tab on each rerun
+TABS_FIXTURE = os.path.join(ROOT, "bench", "fixtures", "app_tabs.py")
+
+# Long enough for the per-session token bucket to refill between interactions
+PAUSE = 2.5
+
+executed = []
+
+class FakeCursor:
+    """Returns just enough rows for every section to render its data"""
+    def execute(self, query, params=()):
+        executed.append(" ".join(query.split())[:60])
+        if "FROM Student S" in query:
+            self.rows = [(1001, "Alice Brown", "alice@example.com", "234-567-8901", 0, 1, 0, 0)]
+        elif "Overdue_Items FROM Student" in query:
+            self.rows = [(0,)]
+        elif "DISTINCT Type" in query:
+            self.rows = [("Ball",), ("Bat",)]
+        elif "Next_Available" in query:
+            self.rows = [(2001, "Basketball", "Ball", "Available", "Good", "N/A")]
+        elif "Due_Date" in query:
+            self.rows = [(3002, "Soccer Ball", date(2026, 1, 5), 3, "Pending", date(2026, 1, 8), "Reserved")]
+        elif "E.Status = 'Available'" in query:
+            self.rows = [(2001, "Basketball", "Ball", "Good")]
+        else:
+            self.rows = []
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def cursor(self, prepared=False):
+        return FakeCursor()
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+def select(at, widget, label):
+    return next(w for w in getattr(at, widget) if w.label == label)
+
+def measure(at, interactions):
+    """Statements executed by each interaction, in order"""
+    counts = []
+    for name, interact in interactions:
+        time.sleep(PAUSE)
+        before = len(executed)
+        interact(at)
+        at.run()
+        counts.append((name, len(executed) - before))
+    return counts
+
+def tabs_interactions():
+    return [
+        ("open student portal", lambda at: None),
+        ("change student ID", lambda at: at.number_input[0].set_value(1002)),
+        ("filter catalog by type", lambda at: select(at, "selectbox", "Filter by Type").set_value("Ball")),
+        ("switch tab (client side, no rerun)", None),
+        ("filter reservations by status", lambda at: select(at, "selectbox", "Filter by Status").set_value("Pending")),
+    ]
+
+def sections_interactions():
+    return [
+        ("open student portal", lambda at: None),
+        ("change student ID", lambda at: at.number_input[0].set_value(1002)),
+        ("filter catalog by type", lambda at: select(at, "selectbox", "Filter by Type").set_value("Ball")),
+        ("switch to Make Reservation", lambda at: at.radio[0].set_value("Make Reservation")),
+        ("switch to Return Equipment", lambda at: at.radio[0].set_value("Return Equipment")),
+        ("switch to My Reservations", lambda at: at.radio[0].set_value("My Reservations")),
+        ("filter reservations by status", lambda at: select(at, "selectbox", "Filter by Status").set_value("Pending")),
+        ("switch to History", lambda at: at.radio[0].set_value("History")),
+        ("switch back to Equipment Catalog", lambda at: at.radio[0].set_value("Equipment Catalog")),
+    ]
+
+def run_version(script, interactions):
+    st.cache_resource.clear()
+    at = AppTest.from_file(script, default_timeout=30)
+    at.session_state["user_type"] = "student_user"
+    at.session_state["admin_id"] = None
+
+    counts = []
+    for name, interact in interactions:
+        if interact is None:
+            # st.tabs switches in the browser without a rerun, so nothing is executed
+            counts.append((name, 0))
+            continue
+        counts.extend(measure(at, [(name, interact)]))
+        assert not at.exception, at.exception
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tabs-revision", help="git revision of app.py to use instead of the st.tabs fixture")
+    args = parser.parse_args()
+
+    mysql.connector.connect = lambda **kwargs: FakeConnection()
+    set_log_level("error")
+
+    if args.tabs_revision:
+        old_source = subprocess.run(["git", "show", f"{args.tabs_revision}:app.py"], cwd=ROOT,
+                                    check=True, capture_output=True, text=True).stdout
+    else:
+        with open(TABS_FIXTURE) as f:
+            old_source = f.read()
+    with tempfile.TemporaryDirectory() as tmp:
+        old_script = os.path.join(tmp, "app.py")
+        with open(old_script, "w") as f:
+            f.write(old_source)
+        tabs_counts = run_version(old_script, tabs_interactions())
+
+    sections_counts = run_version(os.path.join(ROOT, "app.py"), sections_interactions())
+    from db import get_query_stats
+    stats = get_query_stats().snapshot()
+
+    print(f"st.tabs version ({args.tabs_revision or os.path.relpath(TABS_FIXTURE, ROOT)}):")
+    for name, count in tabs_counts:
+        print(f"  {name:<36} {count:>3} statements")
+    print(f"  total {sum(count for _, count in tabs_counts)}")
+    print("lazy sections version (working tree):")
+    for name, count in sections_counts:
+        print(f"  {name:<36} {count:>3} statements")
+    print(f"  total {sum(count for _, count in sections_counts)}")
+    print(f"  QueryStats: {stats}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Startup cost of the monolithic app.py vs the thin entry point with lazily imported pages.
+
+Measures, for each version:
+  * python -X importtime -c "import app": total import time and whether pandas and
+    the MySQL driver are loaded before the login page is shown
+  * first paint of the login page and the admin login click, timed with streamlit's AppTest
+
+The login page and the admin selection page never query the database, so no server is
+needed. The monolithic version is bench/fixtures/app_monolith.py, or any git revision
+of app.py given with --monolith-revision.
+
+    python bench/startup.py > bench/startup.txt
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import streamlit as st
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import USER_CREDENTIALS
+
+# Snapshot of app.py from when it held every page and imported everything up front
+MONOLITH_FIXTURE = os.path.join(ROOT, "bench", "fixtures", "app_monolith.py")
+
+# Modules the login page should not need
+HEAVY_MODULES = ["pandas", "mysql.connector"]
+
+def import_times(script_dir):
+    """Cumulative import time in ms of app and of each heavy module it pulled in"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app"], cwd=script_dir,
+                            capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        # Keep the first (outermost) import of each module
+        times.setdefault(module.strip(), int(cumulative) / 1000)
+    return times
+
+def time_login(script):
+    """Milliseconds for the first paint of the login page and for the admin login click"""
+    st.cache_resource.clear()
+    at = AppTest.from_file(script, default_timeout=30)
+    start = time.perf_counter()
+    at.run()
+    first_paint = (time.perf_counter() - start) * 1000
+
+    at.selectbox[0].set_value("admin_user")
+    at.text_input[0].input(USER_CREDENTIALS["admin_user"])
+    start = time.perf_counter()
+    at.button[0].click().run()
+    login = (time.perf_counter() - start) * 1000
+
+    assert not at.exception, at.exception
+    assert at.title[0].value == "Admin Selection"
+    return first_paint, login
+
+def measure(script_dir, repeat):
+    times = import_times(script_dir)
+    # Modules stay imported between AppTest runs, so these are warm reruns; the cold
+    # import cost is what importtime reports
+    samples = [time_login(os.path.join(script_dir, "app.py")) for _ in range(repeat)]
+    return {
+        "import app": times.get("app", 0.0),
+        **{f"  of which {module}": times.get(module, 0.0) for module in HEAVY_MODULES},
+        "first paint (login page)": statistics.median(first for first, _ in samples),
+        "admin login click": statistics.median(login for _, login in samples),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--monolith-revision", help="git revision of app.py to use instead of the monolith fixture")
+    parser.add_argument("--repeat", type=int, default=5, help="AppTest runs per version")
+    args = parser.parse_args()
+    set_log_level("error")
+
+    if args.monolith_revision:
+        old_source = subprocess.run(["git", "show", f"{args.monolith_revision}:app.py"], cwd=ROOT,
+                                    check=True, capture_output=True, text=True).stdout
+    else:
+        with open(MONOLITH_FIXTURE) as f:
+            old_source = f.read()
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "app.py"), "w") as f:
+            f.write(old_source)
+        monolith = measure(tmp, args.repeat)
+    split = measure(ROOT, args.repeat)
+
+    print(f"{'ms':<28} {'monolith':>20} {'split (working tree)':>22}")
+    for name in monolith:
+        print(f"{name:<28} {monolith[name]:>20.1f} {split[name]:>22.1f}")
+
+if __name__ == "__main__":
+    main()
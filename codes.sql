@@ -176,4 +176,70 @@ BEGIN
         END;
 End//
 
-DELIMITER ;
\ No newline at end of file
+DELIMITER ;
+
+-- Archival of closed Rental/Reservation rows (moved by archive.py)
+-- Archive tables are used instead of RANGE partitioning because InnoDB does not
+-- allow partitioned tables to take part in foreign keys
+
+-- Indexes supporting the hot queries and the archival horizon scans
+CREATE INDEX idx_rental_return_date ON Rental (Return_Date);
+CREATE INDEX idx_reservation_status_date ON Reservation (Return_Status, Date);
+
+-- Same columns and indexes as the live tables, without the foreign keys
+CREATE TABLE Rental_Archive LIKE Rental;
+CREATE TABLE Reservation_Archive LIKE Reservation;
+
+-- Students can read their archived history
+GRANT SELECT ON sports_rental.Rental_Archive TO 'student_user'@'localhost';
+GRANT SELECT ON sports_rental.Reservation_Archive TO 'student_user'@'localhost';
+
+FLUSH PRIVILEGES;
+
+-- Change tracking for incremental report exports (see reports.py)
+ALTER TABLE Student ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_student_last_modified (Last_Modified);
+ALTER TABLE Equipment ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_equipment_last_modified (Last_Modified);
+ALTER TABLE Reservation ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_reservation_last_modified (Last_Modified);
+ALTER TABLE Rental ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_rental_last_modified (Last_Modified);
+
+-- Archive tables keep the same columns so archive.py can copy rows with SELECT *
+ALTER TABLE Reservation_Archive ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_reservation_last_modified (Last_Modified);
+ALTER TABLE Rental_Archive ADD COLUMN Last_Modified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, ADD INDEX idx_rental_last_modified (Last_Modified);
+
+-- Audit trail of admin CRUD and student transactions (written in batches by audit.py)
+CREATE TABLE Audit_Log (
+    Audit_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Event_Time DATETIME(6) NOT NULL,
+    Actor_Type VARCHAR(10) NOT NULL,
+    Actor_ID INT NOT NULL,
+    Action VARCHAR(10) NOT NULL,
+    Entity VARCHAR(20) NOT NULL,
+    Entity_ID INT NOT NULL,
+    Before_Image JSON,
+    After_Image JSON,
+    INDEX idx_audit_entity (Entity, Entity_ID),
+    INDEX idx_audit_event_time (Event_Time)
+);
+
+GRANT INSERT ON sports_rental.Audit_Log TO 'admin_user'@'localhost';
+
+FLUSH PRIVILEGES;
+
+-- Audit_Log is append-only: reject any UPDATE or DELETE
+DELIMITER //
+
+CREATE TRIGGER audit_log_no_update
+BEFORE UPDATE ON Audit_Log
+FOR EACH ROW
+BEGIN
+    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Audit_Log is append-only';
+END//
+
+CREATE TRIGGER audit_log_no_delete
+BEFORE DELETE ON Audit_Log
+FOR EACH ROW
+BEGIN
+    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Audit_Log is append-only';
+END//
+
+DELIMITER ;
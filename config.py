@@ -0,0 +1,8 @@
+# Database connection settings shared by the app pages
+DB_HOST = "localhost"
+DB_NAME = "sports_rental"
+
+USER_CREDENTIALS = {
+    "admin_user": "admin",
+    "student_user": "student"
+}
@@ -0,0 +1,369 @@
+import streamlit as st
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+import queue
+import threading
+import time
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+
+# Connections kept per database user for the prepared statement pool
+POOL_SIZE = 5
+POOL_TIMEOUT = 10  # seconds to wait for a free pooled connection
+# Idle seconds after which a pooled connection is pinged before use; the server drops idle
+# sessions after wait_timeout, and checking every use would add a round trip to each query
+POOL_PING_INTERVAL = 60
+
+# Per-session token bucket for expensive reads
+READ_RATE = 5  # tokens refilled per second
+READ_BURST = 10  # maximum tokens held at once
+
+# Seconds a session reuses its own query results, so switching sections does not hit the database
+SECTION_CACHE_TTL = 30
+
+# Fixed hot queries, prepared once per pooled connection and reused on every rerun
+STATEMENTS = {
+    "student_summary": """
+        SELECT S.Student_ID, S.Name, S.Email, S.Phone, S.Overdue_Items, S.Admin_ID,
+               COUNT(R.Rental_ID) as Active_Rentals,
+               SUM(CASE WHEN R.Return_Date < CURDATE() THEN 1 ELSE 0 END) as Current_Overdue
+        FROM Student S
+        LEFT JOIN Rental R ON S.Student_ID = R.Student_ID AND R.Return_Date IS NULL
+        WHERE S.Student_ID = %s
+        GROUP BY S.Student_ID
+    """,
+    "student_overdue_items": """
+        SELECT Overdue_Items FROM Student WHERE Student_ID = %s
+    """,
+    "equipment_types": """
+        SELECT DISTINCT Type FROM Equipment ORDER BY Type
+    """,
+    "equipment_catalog": """
+        SELECT 
+            E.Equipment_ID,
+            E.Name,
+            E.Type,
+            E.Status,
+            E.Maintenance_Status,
+            CASE 
+                WHEN R.Return_Date IS NOT NULL THEN DATE_FORMAT(R.Return_Date, '%Y-%m-%d')
+                ELSE 'N/A'
+            END as Next_Available
+        FROM Equipment E
+        LEFT JOIN Rental R ON E.Equipment_ID = R.Equipment_ID 
+            AND R.Return_Date >= CURDATE()
+        WHERE (%s = 'All' OR E.Type = %s)
+          AND (%s = 'All' OR E.Status = %s)
+        ORDER BY E.Type, E.Name
+    """,
+    "available_equipment": """
+        SELECT E.Equipment_ID, E.Name, E.Type, E.Maintenance_Status
+        FROM Equipment E
+        WHERE E.Status = 'Available'
+        ORDER BY E.Type, E.Name
+    """,
+    "active_rentals": """
+        SELECT R.Rental_ID, E.Name, R.Rental_Date, R.Return_Date
+        FROM Rental R
+        JOIN Equipment E ON R.Equipment_ID = E.Equipment_ID
+        WHERE R.Student_ID = %s AND R.Return_Date >= CURDATE()
+        AND R.Damage_Report IS NULL
+    """,
+    "student_reservations": """
+        SELECT 
+            R.Reservation_ID,
+            E.Name as Equipment_Name,
+            R.Date as Reservation_Date,
+            R.Rental_Period,
+            R.Return_Status,
+            CASE 
+                WHEN R.Return_Status = 'Pending' THEN DATE_ADD(R.Date, INTERVAL R.Rental_Period DAY)
+                WHEN R.Return_Status = 'In Progress' THEN 
+                    (SELECT RNT.Return_Date 
+                     FROM Rental RNT 
+                     WHERE RNT.Equipment_ID = R.Equipment_ID 
+                     AND RNT.Student_ID = R.Student_ID
+                     ORDER BY RNT.Rental_Date DESC 
+                     LIMIT 1)
+                ELSE NULL
+            END as Due_Date,
+            E.Status as Equipment_Status
+        FROM Reservation R
+        JOIN Equipment E ON R.Equipment_ID = E.Equipment_ID
+        WHERE R.Student_ID = %s
+        ORDER BY R.Date DESC
+    """,
+    "rental_history": """
+        SELECT R.Rental_ID, E.Name, R.Rental_Date, R.Return_Date, 
+               R.Damage_Report, RV.Return_Status
+        FROM Rental R
+        JOIN Equipment E ON R.Equipment_ID = E.Equipment_ID
+        LEFT JOIN Reservation RV ON R.Equipment_ID = RV.Equipment_ID 
+            AND R.Student_ID = RV.Student_ID
+        WHERE R.Student_ID = %s
+        ORDER BY R.Rental_Date DESC
+    """,
+    "rental_history_archived": """
+        SELECT R.Rental_ID, E.Name, R.Rental_Date, R.Return_Date, 
+               R.Damage_Report, RV.Return_Status
+        FROM (
+            SELECT * FROM Rental WHERE Student_ID = %s
+            UNION ALL
+            SELECT * FROM Rental_Archive WHERE Student_ID = %s
+        ) R
+        JOIN Equipment E ON R.Equipment_ID = E.Equipment_ID
+        LEFT JOIN (
+            SELECT Equipment_ID, Student_ID, Return_Status FROM Reservation WHERE Student_ID = %s
+            UNION ALL
+            SELECT Equipment_ID, Student_ID, Return_Status FROM Reservation_Archive WHERE Student_ID = %s
+        ) RV ON R.Equipment_ID = RV.Equipment_ID 
+            AND R.Student_ID = RV.Student_ID
+        ORDER BY R.Rental_Date DESC
+    """,
+}
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers asking for the same key"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Run fn once per key at a time; returns (result, shared)"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"], True
+
+        try:
+            call["result"] = fn()
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+        return call["result"], False
+
+class TokenBucket:
+    """Simple token bucket used to rate limit reads within a session"""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self):
+        """Seconds until the next token becomes available"""
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+class QueryStats:
+    """Thread-safe counters for monitoring database reads"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"executed": 0, "coalesced": 0, "cache_hits": 0, "throttled": 0, "served_stale": 0}
+
+    def incr(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counters)
+
+class PreparedStatementPool:
+    """Pool of connections that keep their server-side prepared statements between uses"""
+    def __init__(self, user, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.user = user
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def _connect(self):
+        # Autocommit so each read sees the latest committed data rather than an old snapshot
+        connection = mysql.connector.connect(
+            host=DB_HOST,
+            user=self.user,
+            password=USER_CREDENTIALS[self.user],
+            database=DB_NAME,
+            autocommit=True
+        )
+        return {"connection": connection, "statements": {}, "idle_since": time.monotonic()}
+
+    def _revive(self, entry):
+        """Reconnect an idle entry the server may have dropped in the meantime"""
+        if time.monotonic() - entry["idle_since"] < POOL_PING_INTERVAL:
+            return entry
+        connection = entry["connection"]
+        try:
+            if not connection.is_connected():
+                connection.reconnect(attempts=1)
+                # Prepared statement handles died with the old session
+                entry["statements"] = {}
+        except Error:
+            self._discard(entry)
+            raise
+        return entry
+
+    def _acquire(self):
+        try:
+            return self._revive(self._idle.get_nowait())
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+
+        if not can_create:
+            try:
+                entry = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise PoolError(f"No pooled connection for {self.user} became free within {self.timeout}s")
+            return self._revive(entry)
+        try:
+            return self._connect()
+        except Error:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, entry):
+        try:
+            entry["connection"].close()
+        except Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def execute(self, name, params=()):
+        """Execute a registered statement, preparing it on first use for this connection"""
+        entry = self._acquire()
+        broken = False
+        try:
+            statement = entry["statements"].get(name)
+            if statement is None:
+                # Keep the exact SQL object: the prepared cursor only skips re-preparing
+                # when it is handed the same string it was prepared with
+                statement = (entry["connection"].cursor(prepared=True), STATEMENTS[name])
+                entry["statements"][name] = statement
+            cursor, query = statement
+            cursor.execute(query, params)
+            return cursor.fetchall()
+        except Error:
+            # The connection may be gone or left mid-result; anything else (an unknown
+            # statement name, a bad parameter) leaves it usable
+            broken = True
+            raise
+        finally:
+            # Every entry goes back or is dropped, whatever went wrong, so the pool never shrinks
+            if broken:
+                self._discard(entry)
+            else:
+                entry["idle_since"] = time.monotonic()
+                self._idle.put(entry)
+
+# Shared across all sessions of this server process
+@st.cache_resource
+def get_single_flight():
+    return SingleFlight()
+
+@st.cache_resource
+def get_query_stats():
+    return QueryStats()
+
+@st.cache_resource
+def get_statement_pool(user):
+    return PreparedStatementPool(user)
+
+def run_query(name, params=(), user="student_user"):
+    """Run a registered read-only statement, coalescing identical concurrent calls and rate limiting per session"""
+    key = (user, name, tuple(params))
+    stats = get_query_stats()
+    bucket = st.session_state.setdefault('read_bucket', TokenBucket(READ_RATE, READ_BURST))
+    last_results = st.session_state.setdefault('last_results', {})
+    cached = last_results.get(key)
+
+    if cached and time.monotonic() - cached[1] < SECTION_CACHE_TTL:
+        stats.incr("cache_hits")
+        return list(cached[0])
+
+    if not bucket.try_acquire():
+        stats.incr("throttled")
+        # Serve the previous result for this query instead of hitting the database again
+        if cached:
+            stats.incr("served_stale")
+            return list(cached[0])
+        time.sleep(bucket.wait_time())
+        bucket.try_acquire()
+
+    def execute():
+        stats.incr("executed")
+        return get_statement_pool(user).execute(name, params)
+
+    try:
+        rows, shared = get_single_flight().do(key, execute)
+    except Error as e:
+        st.error(f"Error: '{e}'")
+        return []
+    if shared:
+        stats.incr("coalesced")
+    last_results[key] = (rows, time.monotonic())
+    # Callers get their own copy since the rows may be shared with other sessions
+    return list(rows)
+
+def clear_read_cache():
+    """Drop per-session query results after a write"""
+    st.session_state['last_results'] = {}
+
+def verify_admin(admin_id):
+    try:
+        connection = mysql.connector.connect(
+            host=DB_HOST,
+            user="admin_user",
+            password=USER_CREDENTIALS["admin_user"],
+            database=DB_NAME
+        )
+        cursor = connection.cursor()
+        cursor.execute("SELECT * FROM Admin WHERE Admin_ID = %s", (admin_id,))
+        admin = cursor.fetchone()
+        cursor.close()
+        connection.close()
+        return admin if admin else None
+    except Error as e:
+        st.error(f"Error: '{e}'")
+        return None
+
+def create_connection(user, password):
+    try:
+        connection = mysql.connector.connect(
+            host=DB_HOST,
+            user=user,
+            password=password,
+            database=DB_NAME
+        )
+        return connection
+    except Error as e:
+        st.error(f"Error: '{e}'")
+        return None
@@ -0,0 +1,129 @@
+from datetime import datetime
+
+# Maximum overdue items a student may hold and still make reservations
+MAX_OVERDUE_ITEMS = 3
+
+def overdue_eligibility(overdue_items):
+    """Check if a student with this many overdue items is eligible for new rentals"""
+    if overdue_items is not None and overdue_items >= MAX_OVERDUE_ITEMS:
+        return False, f"You have {overdue_items} overdue items. Please return them before making new reservations."
+    return True, "Eligible"
+
+def check_student_eligibility(cursor, student_id):
+    """Check if student is eligible for new rentals"""
+    cursor.execute("SELECT Overdue_Items FROM Student WHERE Student_ID = %s", (student_id,))
+    result = cursor.fetchone()
+    return overdue_eligibility(result[0] if result else None)
+
+def check_equipment_availability(cursor, equipment_id):
+    """Check if equipment is available for reservation"""
+    cursor.execute("SELECT Status, Name FROM Equipment WHERE Equipment_ID = %s", (equipment_id,))
+    result = cursor.fetchone()
+    if not result:
+        return False, "Equipment not found"
+    if result[0] != 'Available':
+        return False, f"{result[1]} is currently {result[0]}"
+    return True, "Available"
+
+def next_id(cursor, table, id_column, floor):
+    """Next free ID for a table whose closed rows are moved to {table}_Archive"""
+    # Archiving can move the highest IDs out of the live table, so both tables must be checked
+    cursor.execute(f"""
+        SELECT GREATEST(
+            COALESCE((SELECT MAX({id_column}) FROM {table}), %s),
+            COALESCE((SELECT MAX({id_column}) FROM {table}_Archive), %s)
+        )
+    """, (floor, floor))
+    return cursor.fetchone()[0] + 1
+
+def make_reservation(cursor, student_id, equipment_id, rental_period):
+    """Create a new reservation"""
+    # Generate new reservation ID
+    new_reservation_id = next_id(cursor, "Reservation", "Reservation_ID", 3000)
+    
+    # Create reservation
+    insert_query = """
+    INSERT INTO Reservation (Reservation_ID, Rental_Period, Return_Status, Date, Equipment_ID, Student_ID) 
+    VALUES (%s, %s, 'Pending', CURDATE(), %s, %s)
+    """
+    cursor.execute(insert_query, (new_reservation_id, rental_period, equipment_id, student_id))
+    
+    # Update equipment status
+    cursor.execute("UPDATE Equipment SET Status = 'Reserved' WHERE Equipment_ID = %s", (equipment_id,))
+    
+    return new_reservation_id
+
+def convert_to_rental(cursor, reservation_id):
+    """Convert a reservation to an active rental"""
+    # Get reservation details
+    cursor.execute("""
+        SELECT R.Equipment_ID, R.Student_ID, R.Rental_Period 
+        FROM Reservation R 
+        WHERE R.Reservation_ID = %s AND R.Return_Status = 'Pending'
+    """, (reservation_id,))
+    result = cursor.fetchone()
+    
+    if not result:
+        return False, "Reservation not found or already processed"
+    
+    equipment_id, student_id, rental_period = result
+    
+    # Generate new rental ID
+    new_rental_id = next_id(cursor, "Rental", "Rental_ID", 4000)
+    
+    # Create rental record
+    insert_query = """
+    INSERT INTO Rental (Rental_ID, Rental_Date, Return_Date, Damage_Report, Student_ID, Equipment_ID) 
+    VALUES (%s, CURDATE(), DATE_ADD(CURDATE(), INTERVAL %s DAY), NULL, %s, %s)
+    """
+    cursor.execute(insert_query, (new_rental_id, rental_period, student_id, equipment_id))
+    
+    # Update reservation status
+    cursor.execute("UPDATE Reservation SET Return_Status = 'In Progress' WHERE Reservation_ID = %s", (reservation_id,))
+    
+    # Update equipment status
+    cursor.execute("UPDATE Equipment SET Status = 'In Use' WHERE Equipment_ID = %s", (equipment_id,))
+    
+    return True, new_rental_id
+
+def return_equipment(cursor, rental_id, damage_report=None):
+    """Process equipment return"""
+    # Get rental details
+    cursor.execute("""
+        SELECT R.Equipment_ID, R.Student_ID, R.Return_Date 
+        FROM Rental R 
+        WHERE R.Rental_ID = %s AND R.Return_Date >= CURDATE()
+    """, (rental_id,))
+    result = cursor.fetchone()
+    
+    if not result:
+        return False, "Rental not found or already returned"
+    
+    equipment_id, student_id, return_date = result
+    
+    # Update rental record
+    cursor.execute("""
+        UPDATE Rental 
+        SET Return_Date = CURDATE(), 
+            Damage_Report = %s 
+        WHERE Rental_ID = %s
+    """, (damage_report, rental_id))
+    
+    # Update equipment status based on damage report
+    new_status = 'Maintenance' if damage_report and 'damage' in damage_report.lower() else 'Available'
+    cursor.execute("""
+        UPDATE Equipment 
+        SET Status = %s,
+            Maintenance_Status = %s 
+        WHERE Equipment_ID = %s
+    """, (new_status, 'Needs inspection' if damage_report else 'Good', equipment_id))
+    
+    # Update student's overdue items if returned late
+    if datetime.now().date() > return_date:
+        cursor.execute("""
+            UPDATE Student 
+            SET Overdue_Items = Overdue_Items + 1 
+            WHERE Student_ID = %s
+        """, (student_id,))
+    
+    return True, "Equipment returned successfully"
@@ -0,0 +1,315 @@
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime, timedelta
+import mysql.connector
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config import DB_HOST, DB_NAME, USER_CREDENTIALS
+
+# Exported tables: primary key, source tables (live + archive) and Arrow schema
+EXPORT_TABLES = {
+    "Student": {
+        "key": "Student_ID",
+        "sources": ["Student"],
+        "schema": pa.schema([
+            ("Student_ID", pa.int32()),
+            ("Name", pa.string()),
+            ("Email", pa.string()),
+            ("Phone", pa.string()),
+            ("Overdue_Items", pa.int32()),
+            ("Admin_ID", pa.int32()),
+            ("Last_Modified", pa.timestamp("s")),
+        ]),
+    },
+    "Equipment": {
+        "key": "Equipment_ID",
+        "sources": ["Equipment"],
+        "schema": pa.schema([
+            ("Equipment_ID", pa.int32()),
+            ("Name", pa.string()),
+            ("Type", pa.string()),
+            ("Status", pa.string()),
+            ("Maintenance_Status", pa.string()),
+            ("Admin_ID", pa.int32()),
+            ("Last_Modified", pa.timestamp("s")),
+        ]),
+    },
+    "Reservation": {
+        "key": "Reservation_ID",
+        "sources": ["Reservation", "Reservation_Archive"],
+        "schema": pa.schema([
+            ("Reservation_ID", pa.int32()),
+            ("Rental_Period", pa.int32()),
+            ("Return_Status", pa.string()),
+            ("Date", pa.date32()),
+            ("Equipment_ID", pa.int32()),
+            ("Student_ID", pa.int32()),
+            ("Last_Modified", pa.timestamp("s")),
+        ]),
+    },
+    "Rental": {
+        "key": "Rental_ID",
+        "sources": ["Rental", "Rental_Archive"],
+        "schema": pa.schema([
+            ("Rental_ID", pa.int32()),
+            ("Rental_Date", pa.date32()),
+            ("Return_Date", pa.date32()),
+            ("Damage_Report", pa.string()),
+            ("Student_ID", pa.int32()),
+            ("Equipment_ID", pa.int32()),
+            ("Last_Modified", pa.timestamp("s")),
+        ]),
+    },
+}
+
+# Damage reports that do not describe any damage
+NO_DAMAGE_REPORTS = ["", "none", "good"]
+
+WATERMARK_FILE = "_watermark.json"
+
+# Key snapshots live outside the table directories so they are not read as data
+KEYS_DIR = "_keys"
+
+# Compact a table once incremental runs have left this many partitions behind
+MAX_PARTITIONS = 20
+
+def load_watermarks(output_dir):
+    """Read the last exported Last_Modified per table"""
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {table: datetime.fromisoformat(value) for table, value in json.load(f).items()}
+
+def save_watermarks(output_dir, watermarks):
+    path = os.path.join(output_dir, WATERMARK_FILE)
+    with open(path, "w") as f:
+        json.dump({table: value.isoformat() for table, value in watermarks.items()}, f, indent=2)
+
+def export_table(connection, table, output_dir, run_id, since, chunk_size):
+    """Stream rows changed since the watermark into one Parquet partition, chunk by chunk"""
+    spec = EXPORT_TABLES[table]
+    schema = spec["schema"]
+    columns = ", ".join(schema.names)
+
+    # >= rather than > so rows committed later within the same second are not missed;
+    # duplicates are dropped by primary key when the data is read back
+    query = " UNION ALL ".join(
+        f"SELECT {columns} FROM {source} WHERE Last_Modified >= %s" for source in spec["sources"]
+    )
+    params = [since] * len(spec["sources"])
+
+    # The default mysql.connector cursor is unbuffered, so rows stay on the server until fetched
+    cursor = connection.cursor()
+    cursor.execute(query, params)
+
+    partition_dir = os.path.join(output_dir, table, f"run={run_id}")
+    writer = None
+    exported = 0
+    watermark = None
+
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        if writer is None:
+            os.makedirs(partition_dir, exist_ok=True)
+            writer = pq.ParquetWriter(os.path.join(partition_dir, "part-0.parquet"), schema)
+
+        arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        exported += len(rows)
+
+        chunk_max = max(row[-1] for row in rows)
+        watermark = chunk_max if watermark is None else max(watermark, chunk_max)
+
+    cursor.close()
+    if writer is not None:
+        writer.close()
+    return exported, watermark
+
+def export_keys(connection, table, output_dir, chunk_size):
+    """Snapshot every primary key currently in the database, so deleted rows can be dropped on read"""
+    spec = EXPORT_TABLES[table]
+    key = spec["key"]
+    key_schema = pa.schema([spec["schema"].field(key)])
+
+    # Rows moved to the archive table are still present, so both sources are read in one statement
+    query = " UNION ALL ".join(f"SELECT {key} FROM {source}" for source in spec["sources"])
+    cursor = connection.cursor()
+    cursor.execute(query)
+
+    keys_dir = os.path.join(output_dir, KEYS_DIR)
+    os.makedirs(keys_dir, exist_ok=True)
+    path = os.path.join(keys_dir, f"{table}.parquet")
+    tmp_path = path + ".tmp"
+    keys = 0
+    with pq.ParquetWriter(tmp_path, key_schema) as writer:
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            writer.write_table(pa.Table.from_arrays([pa.array([row[0] for row in rows], type=key_schema.field(0).type)], schema=key_schema))
+            keys += len(rows)
+    cursor.close()
+
+    # Replace the previous snapshot only once the new one is complete
+    os.replace(tmp_path, path)
+    return keys
+
+def partitions(output_dir, table):
+    """run= partition directories of an exported table, oldest run first"""
+    path = os.path.join(output_dir, table)
+    if not os.path.exists(path):
+        return []
+    return sorted(name for name in os.listdir(path) if name.startswith("run="))
+
+def read_table(output_dir, table, columns):
+    """Load the latest version of each exported row that still exists, reading only the given columns"""
+    spec = EXPORT_TABLES[table]
+    names = partitions(output_dir, table)
+    if not names:
+        return pd.DataFrame(columns=columns)
+
+    # Partitions are read oldest run first: a row changed twice within the same second is
+    # exported twice with the same Last_Modified, and the later run holds the newer version
+    needed = list(dict.fromkeys([spec["key"], "Last_Modified"] + columns))
+    df = pd.concat(
+        [pd.read_parquet(os.path.join(output_dir, table, name), columns=needed).assign(_run=order)
+         for order, name in enumerate(names)],
+        ignore_index=True,
+    )
+    df = df.sort_values(["Last_Modified", "_run"], kind="stable").drop_duplicates(spec["key"], keep="last")
+
+    # Anti-join against the latest key snapshot to drop rows deleted since they were exported
+    keys_path = os.path.join(output_dir, KEYS_DIR, f"{table}.parquet")
+    if os.path.exists(keys_path):
+        live = pd.read_parquet(keys_path)[spec["key"]]
+        df = df[df[spec["key"]].isin(live)]
+    return df[columns].reset_index(drop=True)
+
+def compact_table(output_dir, table, run_id):
+    """Rewrite a table's partitions as one, keeping only the latest version of each live row"""
+    spec = EXPORT_TABLES[table]
+    schema = spec["schema"]
+    old_partitions = partitions(output_dir, table)
+    if not old_partitions:
+        return 0
+
+    df = read_table(output_dir, table, schema.names)
+    # Written under a name the reader ignores, then renamed into place; if the old
+    # partitions are not all removed afterwards, duplicates are still dropped on read
+    tmp_dir = os.path.join(output_dir, table, f"_compact={run_id}")
+    os.makedirs(tmp_dir, exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), os.path.join(tmp_dir, "part-0.parquet"))
+    os.rename(tmp_dir, os.path.join(output_dir, table, f"run={run_id}-compacted"))
+
+    for name in old_partitions:
+        shutil.rmtree(os.path.join(output_dir, table, name))
+    return len(df)
+
+def overdue_report(output_dir, today):
+    """Active rentals whose return date has passed"""
+    rentals = read_table(output_dir, "Rental", ["Rental_ID", "Rental_Date", "Return_Date", "Damage_Report", "Student_ID", "Equipment_ID"])
+    students = read_table(output_dir, "Student", ["Student_ID", "Name", "Email"])
+    equipment = read_table(output_dir, "Equipment", ["Equipment_ID", "Name"])
+
+    # Rentals still out have no damage report yet (it is filled in on return)
+    return_date = pd.to_datetime(rentals["Return_Date"])
+    overdue = rentals[rentals["Damage_Report"].isna() & (return_date < today)].copy()
+    overdue["Days_Overdue"] = (today - pd.to_datetime(overdue["Return_Date"])).dt.days
+
+    overdue = overdue.merge(students.rename(columns={"Name": "Student_Name"}), on="Student_ID", how="left")
+    overdue = overdue.merge(equipment.rename(columns={"Name": "Equipment_Name"}), on="Equipment_ID", how="left")
+    return overdue[["Rental_ID", "Student_ID", "Student_Name", "Email", "Equipment_ID", "Equipment_Name",
+                    "Rental_Date", "Return_Date", "Days_Overdue"]].sort_values("Days_Overdue", ascending=False)
+
+def utilization_report(output_dir, today, window_days):
+    """Share of the reporting window each piece of equipment spent rented out"""
+    rentals = read_table(output_dir, "Rental", ["Rental_ID", "Rental_Date", "Return_Date", "Equipment_ID"])
+    equipment = read_table(output_dir, "Equipment", ["Equipment_ID", "Name", "Type", "Status"])
+    window_start = today - timedelta(days=window_days)
+
+    # Clip every rental to the window; rentals still out count up to today
+    start = pd.to_datetime(rentals["Rental_Date"]).clip(lower=window_start)
+    end = pd.to_datetime(rentals["Return_Date"]).fillna(today).clip(upper=today)
+    rentals["Rented_Days"] = (end - start).dt.days.clip(lower=0)
+
+    usage = rentals.groupby("Equipment_ID").agg(Rentals=("Rental_ID", "count"), Rented_Days=("Rented_Days", "sum"))
+    report = equipment.merge(usage, left_on="Equipment_ID", right_index=True, how="left")
+    report[["Rentals", "Rented_Days"]] = report[["Rentals", "Rented_Days"]].fillna(0).astype(int)
+    report["Utilization"] = (report["Rented_Days"] / window_days).round(3)
+    return report.sort_values("Utilization", ascending=False)
+
+def damage_report(output_dir):
+    """Damage reports filed on returns, summarised per piece of equipment"""
+    rentals = read_table(output_dir, "Rental", ["Rental_ID", "Return_Date", "Damage_Report", "Equipment_ID"])
+    equipment = read_table(output_dir, "Equipment", ["Equipment_ID", "Name", "Type", "Maintenance_Status"])
+
+    reports = rentals["Damage_Report"].fillna("").str.strip()
+    damaged = rentals[~reports.str.lower().isin(NO_DAMAGE_REPORTS)]
+
+    summary = damaged.sort_values("Return_Date").groupby("Equipment_ID").agg(
+        Reports=("Rental_ID", "count"),
+        Latest_Report=("Damage_Report", "last"),
+        Latest_Return=("Return_Date", "last"),
+    )
+    report = equipment.merge(summary, left_on="Equipment_ID", right_index=True, how="inner")
+    return report.sort_values("Reports", ascending=False)
+
+def main():
+    parser = argparse.ArgumentParser(description="Export rental data to Parquet and build the standard reports")
+    parser.add_argument("--output-dir", default="exports", help="Directory for Parquet partitions and reports")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Rows fetched and written per chunk")
+    parser.add_argument("--full", action="store_true", help="Ignore the watermark and export every row")
+    parser.add_argument("--window-days", type=int, default=90, help="Window used for the utilization report")
+    parser.add_argument("--max-partitions", type=int, default=MAX_PARTITIONS,
+                        help="Compact a table once it has more partitions than this (0 compacts every run)")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+    watermarks = {} if args.full else load_watermarks(args.output_dir)
+
+    connection = mysql.connector.connect(
+        host=DB_HOST,
+        user="admin_user",
+        password=USER_CREDENTIALS["admin_user"],
+        database=DB_NAME
+    )
+    try:
+        for table in EXPORT_TABLES:
+            since = watermarks.get(table, datetime(1970, 1, 1))
+            exported, watermark = export_table(connection, table, args.output_dir, run_id, since, args.chunk_size)
+            if watermark is not None:
+                watermarks[table] = watermark
+            keys = export_keys(connection, table, args.output_dir, args.chunk_size)
+            print(f"{table}: exported {exported} rows, {keys} live keys")
+    finally:
+        connection.close()
+
+    # Only advance the watermark once every table exported successfully
+    save_watermarks(args.output_dir, watermarks)
+
+    for table in EXPORT_TABLES:
+        if len(partitions(args.output_dir, table)) > args.max_partitions:
+            rows = compact_table(args.output_dir, table, run_id)
+            print(f"{table}: compacted into {rows} rows")
+
+    today = pd.Timestamp(datetime.now().date())
+    report_dir = os.path.join(args.output_dir, "reports", run_id)
+    os.makedirs(report_dir, exist_ok=True)
+    reports = {
+        "overdue": overdue_report(args.output_dir, today),
+        "utilization": utilization_report(args.output_dir, today, args.window_days),
+        "damage_summary": damage_report(args.output_dir),
+    }
+    for name, df in reports.items():
+        df.to_parquet(os.path.join(report_dir, f"{name}.parquet"), index=False)
+        print(f"{name}: {len(df)} rows")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import threading
+import pytest
+import audit
+from mysql.connector import Error, errors
+
+class RecordingLogger(audit.AuditLogger):
+    """Keeps written events in memory instead of inserting them"""
+    def __init__(self, failures=0, **kwargs):
+        self.written = []
+        self.batches = 0
+        self.failures = failures
+        super().__init__(**kwargs)
+
+    def _write(self, batch):
+        if self.failures:
+            self.failures -= 1
+            return False
+        self.batches += 1
+        self.written.extend(batch)
+        return True
+
+def test_every_event_is_written_under_concurrent_logging():
+    logger = RecordingLogger(maxsize=5, batch_size=8, flush_interval=0.05)
+    threads_count, events_per_thread = 16, 200
+    barrier = threading.Barrier(threads_count)
+
+    def worker(thread_id):
+        barrier.wait()
+        for i in range(events_per_thread):
+            logger.log("student", thread_id, "INSERT", "Reservation", i)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.close()
+
+    assert len(logger.written) == threads_count * events_per_thread
+    assert {(event[2], event[5]) for event in logger.written} == {
+        (n, i) for n in range(threads_count) for i in range(events_per_thread)
+    }
+
+def test_failed_batches_are_retried_before_new_events(monkeypatch):
+    monkeypatch.setattr(audit.time, "sleep", lambda seconds: None)
+    logger = RecordingLogger(failures=3, flush_interval=0.05)
+    for i in range(3):
+        logger.log("admin", 1, "UPDATE", "Equipment", i)
+    logger.close()
+
+    assert [event[5] for event in logger.written] == [0, 1, 2]
+
+def test_log_after_close_raises_instead_of_losing_the_event():
+    logger = RecordingLogger(flush_interval=0.05)
+    logger.log("admin", 1, "DELETE", "Student", 1001)
+    logger.close()
+
+    with pytest.raises(RuntimeError):
+        logger.log("admin", 1, "DELETE", "Student", 1002)
+    assert [event[5] for event in logger.written] == [1001]
+
+class RejectingLogger(RecordingLogger):
+    """Permanently rejects batches containing an event for entity_id 'bad'"""
+    def _write(self, batch):
+        if any(event[5] == "bad" for event in batch):
+            raise errors.DataError(msg="Data too long for column 'Entity_ID'", errno=1406)
+        return super()._write(batch)
+
+def test_permanent_errors_set_the_bad_event_aside_and_keep_writing(capsys):
+    logger = RejectingLogger(batch_size=8, flush_interval=0.05)
+    # Fill the queue before the writer wakes up so everything lands in a single batch
+    with logger._close_lock:
+        for key in [1, 2, 3, "bad", 5, 6, 7]:
+            logger._queue.put(("now", "admin", 1, "UPDATE", "Equipment", key, None, None))
+    logger.close()
+
+    assert sorted(event[5] for event in logger.written) == [1, 2, 3, 5, 6, 7]
+    assert "Unwritten audit event" in capsys.readouterr().err
+
+def test_log_gives_up_when_the_writer_is_stuck(monkeypatch, capsys):
+    monkeypatch.setattr(audit, "AUDIT_PUT_TIMEOUT", 0.05)
+    monkeypatch.setattr(audit.time, "sleep", lambda seconds: None)
+    logger = RecordingLogger(failures=10 ** 9, maxsize=1, flush_interval=0.05)
+
+    # One batch stuck in retries plus one event in the queue; the rest time out instead of blocking
+    for i in range(5):
+        logger.log("student", 1001, "INSERT", "Reservation", i)
+    logger.close()
+
+    assert logger.written == []
+    assert capsys.readouterr().err.count("Unwritten audit event") == 5
+
+def test_is_transient():
+    assert audit.is_transient(errors.OperationalError(msg="Lost connection", errno=2013))
+    assert audit.is_transient(errors.DatabaseError(msg="Deadlock found", errno=1213))
+    assert not audit.is_transient(errors.ProgrammingError(msg="Table 'Audit_Log' doesn't exist", errno=1146))
+
+class FailingCursor:
+    def __init__(self):
+        self.closed = False
+
+    def executemany(self, query, rows):
+        raise Error("Lost connection to MySQL server")
+
+    def close(self):
+        self.closed = True
+
+class FailingConnection:
+    def __init__(self):
+        self.closed = False
+        self.cursors = []
+
+    def cursor(self):
+        self.cursors.append(FailingCursor())
+        return self.cursors[-1]
+
+    def close(self):
+        self.closed = True
+
+def test_write_error_closes_cursor_and_connection(monkeypatch):
+    connection = FailingConnection()
+    monkeypatch.setattr(audit.mysql.connector, "connect", lambda **kwargs: connection)
+    logger = audit.AuditLogger(flush_interval=0.05)
+    logger.close()
+
+    assert logger._write([("event",)]) is False
+    assert connection.cursors[0].closed
+    assert connection.closed
+    assert logger._connection is None
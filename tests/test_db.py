@@ -0,0 +1,163 @@
+import threading
+import time
+import pytest
+import db
+
+def test_single_flight_runs_identical_concurrent_calls_once():
+    single_flight = db.SingleFlight()
+    executions = []
+    barrier = threading.Barrier(50)
+    results = []
+
+    def query():
+        executions.append(1)
+        # Keep the call in flight long enough for every thread to join it
+        time.sleep(0.2)
+        return [("Basketball",)]
+
+    def worker():
+        barrier.wait()
+        results.append(single_flight.do("k", query))
+
+    threads = [threading.Thread(target=worker) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(executions) == 1
+    assert len(results) == 50
+    assert all(rows == [("Basketball",)] for rows, _ in results)
+    assert sum(shared for _, shared in results) == 49
+
+def test_single_flight_shares_errors_and_forgets_finished_calls():
+    single_flight = db.SingleFlight()
+
+    def failing():
+        raise RuntimeError("database down")
+
+    with pytest.raises(RuntimeError):
+        single_flight.do("k", failing)
+
+    # A finished call is not reused, so the next caller runs fn again
+    assert single_flight.do("k", lambda: 42) == (42, False)
+
+def test_token_bucket_throttles_after_burst(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    bucket = db.TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, True]
+    assert bucket.try_acquire() is False
+    assert bucket.wait_time() == pytest.approx(0.5)
+
+def test_token_bucket_refills_up_to_capacity(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    bucket = db.TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        bucket.try_acquire()
+
+    now[0] += 0.5
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+    # A long idle period never stores more than the capacity
+    now[0] += 60
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+class FakeCursor:
+    def execute(self, query, params):
+        if params == ("bad",):
+            raise TypeError("cannot convert parameter")
+        if params == ("lost",):
+            raise db.Error("Lost connection to MySQL server during query")
+
+    def fetchall(self):
+        return [(1,)]
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.connected = True
+        self.reconnects = 0
+
+    def cursor(self, prepared=False):
+        return FakeCursor()
+
+    def is_connected(self):
+        return self.connected
+
+    def reconnect(self, attempts=1):
+        self.connected = True
+        self.reconnects += 1
+
+    def close(self):
+        self.closed = True
+
+def fake_pool(size=2, timeout=0.2):
+    pool = db.PreparedStatementPool("student_user", size=size, timeout=timeout)
+    pool._connect = lambda: {"connection": FakeConnection(), "statements": {}, "idle_since": db.time.monotonic()}
+    return pool
+
+def test_pool_keeps_connections_after_non_database_errors():
+    pool = fake_pool(size=2)
+
+    # More failures than the pool holds: leaked entries would make the last calls hang
+    for _ in range(5):
+        with pytest.raises(KeyError):
+            pool.execute("no_such_statement")
+        with pytest.raises(TypeError):
+            pool.execute("student_summary", ("bad",))
+
+    # The one healthy connection is reused throughout instead of being closed and reopened
+    assert pool._created == 1
+    connection = pool._idle.queue[0]["connection"]
+    assert pool.execute("student_summary", (1001,)) == [(1,)]
+    assert pool._created == 1
+    assert not connection.closed
+
+def test_pool_discards_connections_after_database_errors():
+    pool = fake_pool(size=1)
+    with pytest.raises(db.Error):
+        pool.execute("student_summary", ("lost",))
+
+    assert pool._created == 0
+    assert pool._idle.empty()
+    assert pool.execute("student_summary", (1001,)) == [(1,)]
+
+def test_pool_reconnects_stale_idle_connections(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    pool = fake_pool(size=1)
+    pool.execute("student_summary", (1001,))
+    entry = pool._idle.queue[0]
+    old_statement = entry["statements"]["student_summary"]
+
+    # The server dropped the session after wait_timeout
+    entry["connection"].connected = False
+    now[0] += db.POOL_PING_INTERVAL + 1
+
+    assert pool.execute("student_summary", (1001,)) == [(1,)]
+    assert entry["connection"].reconnects == 1
+    assert pool._created == 1
+    # Prepared statements of the old session were dropped and prepared again
+    assert entry["statements"]["student_summary"] is not old_statement
+
+def test_pool_skips_the_ping_for_recently_used_connections(monkeypatch):
+    pool = fake_pool(size=1)
+    pool.execute("student_summary", (1001,))
+    connection = pool._idle.queue[0]["connection"]
+    connection.is_connected = lambda: pytest.fail("pinged a connection used a moment ago")
+
+    assert pool.execute("student_summary", (1001,)) == [(1,)]
+
+def test_pool_raises_when_no_connection_frees_up():
+    pool = fake_pool(size=1, timeout=0.1)
+    held = pool._acquire()
+
+    with pytest.raises(db.PoolError):
+        pool.execute("student_summary", (1001,))
+
+    pool._idle.put(held)
+    assert pool.execute("student_summary", (1001,)) == [(1,)]
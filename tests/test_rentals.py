@@ -0,0 +1,43 @@
+import sqlite3
+import pytest
+import rentals
+
+class SqliteCursor:
+    """Runs the MySQL statements in rentals.py against sqlite"""
+    def __init__(self, connection):
+        self.cursor = connection.cursor()
+
+    def execute(self, query, params=()):
+        query = query.replace("%s", "?").replace("GREATEST(", "MAX(").replace("CURDATE()", "DATE('now')")
+        self.cursor.execute(query, params)
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+@pytest.fixture
+def cursor():
+    connection = sqlite3.connect(":memory:")
+    for table in ("Reservation", "Reservation_Archive"):
+        connection.execute(f"""
+            CREATE TABLE {table} (Reservation_ID INTEGER PRIMARY KEY, Rental_Period INTEGER, Return_Status TEXT,
+                                  Date TEXT, Equipment_ID INTEGER, Student_ID INTEGER)
+        """)
+    connection.execute("CREATE TABLE Equipment (Equipment_ID INTEGER PRIMARY KEY, Status TEXT)")
+    connection.execute("INSERT INTO Equipment VALUES (2001, 'Available')")
+    yield SqliteCursor(connection)
+    connection.close()
+
+def test_new_ids_skip_ids_already_moved_to_the_archive(cursor):
+    # The highest reservations were closed and archived, leaving a lower live ID
+    cursor.execute("INSERT INTO Reservation VALUES (3001, 7, 'In Progress', '2026-01-01', 2001, 1001)")
+    for reservation_id in (3002, 3003):
+        cursor.execute("INSERT INTO Reservation_Archive VALUES (%s, 7, 'Returned', '2025-01-01', 2001, 1001)", (reservation_id,))
+
+    assert rentals.make_reservation(cursor, 1001, 2001, 7) == 3004
+
+def test_new_ids_when_every_row_was_archived(cursor):
+    cursor.execute("INSERT INTO Reservation_Archive VALUES (3005, 7, 'Returned', '2025-01-01', 2001, 1001)")
+    assert rentals.next_id(cursor, "Reservation", "Reservation_ID", 3000) == 3006
+
+def test_new_ids_start_after_the_floor(cursor):
+    assert rentals.next_id(cursor, "Reservation", "Reservation_ID", 3000) == 3001
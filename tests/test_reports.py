@@ -0,0 +1,88 @@
+from datetime import datetime
+import reports
+
+class FakeCursor:
+    """Streams canned rows through fetchmany like the unbuffered mysql.connector cursor"""
+    def __init__(self, tables):
+        self.tables = tables
+
+    def execute(self, query, params=()):
+        # export_table selects every column, export_keys only the key
+        self.rows = [row for row in self.tables["Equipment"]]
+        if query.startswith("SELECT Equipment_ID FROM"):
+            self.rows = [(row[0],) for row in self.rows]
+        elif params:
+            self.rows = [row for row in self.rows if row[-1] >= params[0]]
+
+    def fetchmany(self, size):
+        chunk, self.rows = self.rows[:size], self.rows[size:]
+        return chunk
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self):
+        self.tables = {"Equipment": []}
+
+    def cursor(self):
+        return FakeCursor(self.tables)
+
+def run(connection, output_dir, run_id, since):
+    _, watermark = reports.export_table(connection, "Equipment", output_dir, run_id, since, chunk_size=2)
+    reports.export_keys(connection, "Equipment", output_dir, chunk_size=2)
+    return watermark
+
+def equipment(equipment_id, status, modified):
+    return (equipment_id, f"Item {equipment_id}", "Ball", status, "Good", 1, modified)
+
+def test_read_table_drops_updated_and_deleted_rows(tmp_path):
+    connection = FakeConnection()
+    connection.tables["Equipment"] = [equipment(i, "Available", datetime(2026, 1, 1)) for i in (2001, 2002, 2003)]
+    watermark = run(connection, tmp_path, "20260101T000000", datetime(1970, 1, 1))
+
+    # 2002 is updated and 2003 deleted: the incremental export only sees the update
+    connection.tables["Equipment"] = [
+        equipment(2001, "Available", datetime(2026, 1, 1)),
+        equipment(2002, "Rented", datetime(2026, 1, 2)),
+    ]
+    run(connection, tmp_path, "20260102T000000", watermark)
+
+    df = reports.read_table(tmp_path, "Equipment", ["Equipment_ID", "Status"])
+    assert sorted(df.itertuples(index=False, name=None)) == [(2001, "Available"), (2002, "Rented")]
+
+def test_compact_table_leaves_one_partition_with_the_same_rows(tmp_path):
+    connection = FakeConnection()
+    watermark = datetime(1970, 1, 1)
+    for day in range(1, 5):
+        connection.tables["Equipment"] = [equipment(2000 + i, "Available", datetime(2026, 1, day)) for i in range(1, day + 1)]
+        watermark = run(connection, tmp_path, f"2026010{day}T000000", watermark)
+    # A deleted row only shows up in the key snapshot
+    connection.tables["Equipment"].pop(0)
+    reports.export_keys(connection, "Equipment", tmp_path, chunk_size=2)
+
+    columns = list(reports.EXPORT_TABLES["Equipment"]["schema"].names)
+    before = reports.read_table(tmp_path, "Equipment", columns)
+    assert len(reports.partitions(tmp_path, "Equipment")) == 4
+
+    assert reports.compact_table(tmp_path, "Equipment", "20260105T000000") == 3
+    assert reports.partitions(tmp_path, "Equipment") == ["run=20260105T000000-compacted"]
+    after = reports.read_table(tmp_path, "Equipment", columns)
+    assert after.sort_values("Equipment_ID").reset_index(drop=True).equals(before.sort_values("Equipment_ID").reset_index(drop=True))
+
+def test_later_run_wins_when_versions_share_last_modified(tmp_path):
+    connection = FakeConnection()
+    same_second = datetime(2026, 1, 1, 12, 0, 0)
+    connection.tables["Equipment"] = [equipment(2000 + i, "Available", same_second) for i in range(500)]
+    watermark = run(connection, tmp_path, "20260101T120000", datetime(1970, 1, 1))
+
+    # Changed again within the same second: re-exported by the >= watermark with the same Last_Modified
+    connection.tables["Equipment"] = [equipment(2000 + i, "Rented", same_second) for i in range(500)]
+    run(connection, tmp_path, "20260101T120001", watermark)
+
+    df = reports.read_table(tmp_path, "Equipment", ["Equipment_ID", "Status"])
+    assert len(df) == 500
+    assert set(df["Status"]) == {"Rented"}
+
+    reports.compact_table(tmp_path, "Equipment", "20260101T120001")
+    assert set(reports.read_table(tmp_path, "Equipment", ["Status"])["Status"]) == {"Rented"}
@@ -0,0 +1,305 @@
+import streamlit as st
+import pandas as pd
+from config import USER_CREDENTIALS
+from db import create_connection, get_query_stats
+from audit import fetch_row, get_audit_logger
+
+# Primary key of each entity, used to capture row images for the audit log
+ENTITY_KEYS = {
+    "Equipment": "Equipment_ID",
+    "Student": "Student_ID",
+    "Reservation": "Reservation_ID",
+    "Rental": "Rental_ID"
+}
+
+def audited_execute(connection, cursor, entity, action, key, query, params):
+    """Run an admin write, commit it and queue its before/after row images for the audit log"""
+    key_column = ENTITY_KEYS[entity]
+    before = fetch_row(cursor, entity, key_column, key) if action != "INSERT" else None
+    cursor.execute(query, params)
+    after = fetch_row(cursor, entity, key_column, key) if action != "DELETE" else None
+    connection.commit()
+    get_audit_logger().log("admin", st.session_state['admin_id'], action, entity, key, before, after)
+
+def render():
+    """Admin dashboard with CRUD operations on each entity"""
+    st.title(f"Welcome Admin {st.session_state['admin_id']}!")
+    st.sidebar.header("Admin Dashboard")
+    
+    entity = st.sidebar.selectbox("Select Entity", ["Equipment", "Reservation", "Student", "Rental"])
+    operation = st.sidebar.radio("Choose Operation", ["View", "Add", "Update", "Delete"])
+    
+    connection = create_connection("admin_user", USER_CREDENTIALS["admin_user"])
+
+    if connection:
+        cursor = connection.cursor()
+        
+        # Equipment Operations
+        if entity == "Equipment":
+            if operation == "View":
+                cursor.execute("SELECT * FROM Equipment")
+                data = cursor.fetchall()
+                df = pd.DataFrame(data, columns=[column[0] for column in cursor.description])
+                st.write(df)
+
+            elif operation == "Add":
+                equipment_id = st.number_input("Equipment ID", min_value=1)
+                equipment_name = st.text_input("Equipment Name")
+                equipment_type = st.text_input("Equipment Type")
+                equipment_status = st.text_input("Status")
+                equipment_maintenance = st.text_input("Maintenance Status")
+                
+                if st.button("Add Equipment"):
+                    insert_query = """
+                    INSERT INTO Equipment (Equipment_ID, Name, Type, Status, Maintenance_Status, Admin_ID) 
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    audited_execute(connection, cursor, "Equipment", "INSERT", equipment_id, insert_query,
+                                    (equipment_id, equipment_name, equipment_type, equipment_status, 
+                                     equipment_maintenance, st.session_state['admin_id']))
+                    st.success("Equipment added successfully.")
+                    
+            elif operation == "Update":
+                equipment_id = st.number_input("Enter Equipment ID to Update", min_value=1)
+                
+                cursor.execute("SELECT * FROM Equipment WHERE Equipment_ID = %s", (equipment_id,))
+                data = cursor.fetchone()
+                
+                if data:
+                    name = st.text_input("Equipment Name", value=data[1])
+                    equipment_type = st.text_input("Equipment Type", value=data[2])
+                    status = st.text_input("Status", value=data[3])
+                    maintenance_status = st.text_input("Maintenance Status", value=data[4])
+
+                    if st.button("Update Equipment"):
+                        update_query = """
+                        UPDATE Equipment 
+                        SET 
+                            Name = COALESCE(%s, Name),
+                            Type = COALESCE(%s, Type),
+                            Status = COALESCE(%s, Status),
+                            Maintenance_Status = COALESCE(%s, Maintenance_Status),
+                            Admin_ID = %s
+                        WHERE Equipment_ID = %s
+                        """
+                        audited_execute(connection, cursor, "Equipment", "UPDATE", equipment_id, update_query,
+                                        (name, equipment_type, status, maintenance_status, 
+                                         st.session_state['admin_id'], equipment_id))
+                        st.success("Equipment updated successfully.")
+                else:
+                    st.error("Equipment not found.")
+            
+            elif operation == "Delete":
+                equipment_id = st.number_input("Enter Equipment ID to Delete", min_value=1)
+                
+                if st.button("Delete Equipment"):
+                    delete_query = "DELETE FROM Equipment WHERE Equipment_ID = %s"
+                    audited_execute(connection, cursor, "Equipment", "DELETE", equipment_id, delete_query, (equipment_id,))
+                    st.success("Equipment deleted successfully.")
+
+        # Student Operations
+        elif entity == "Student":
+            if operation == "View":
+                cursor.execute("SELECT * FROM Student")
+                data = cursor.fetchall()
+                df = pd.DataFrame(data, columns=[column[0] for column in cursor.description])
+                st.write(df)
+            
+            elif operation == "Add":
+                student_id = st.number_input("Student ID", min_value=1)
+                name = st.text_input("Student Name")
+                email = st.text_input("Email")
+                phone = st.text_input("Phone")
+                overdue_items = st.number_input("Overdue Items", min_value=0)
+                
+                if st.button("Add Student"):
+                    insert_query = """
+                    INSERT INTO Student (Student_ID, Name, Email, Phone, Overdue_Items, Admin_ID) 
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    audited_execute(connection, cursor, "Student", "INSERT", student_id, insert_query,
+                                    (student_id, name, email, phone, overdue_items, 
+                                     st.session_state['admin_id']))
+                    st.success("Student added successfully.")
+            
+            elif operation == "Update":
+                student_id = st.number_input("Enter Student ID to Update", min_value=1)
+                
+                cursor.execute("SELECT * FROM Student WHERE Student_ID = %s", (student_id,))
+                data = cursor.fetchone()
+
+                if data:
+                    name = st.text_input("Student Name", value=data[1])
+                    email = st.text_input("Email", value=data[2])
+                    phone = st.text_input("Phone", value=data[3])
+                    overdue_items = st.number_input("Overdue Items", min_value=0, value=data[4])
+
+                    if st.button("Update Student"):
+                        update_query = """
+                        UPDATE Student 
+                        SET 
+                            Name = COALESCE(NULLIF(%s, ''), Name),
+                            Email = COALESCE(NULLIF(%s, ''), Email),
+                            Phone = COALESCE(NULLIF(%s, ''), Phone),
+                            Overdue_Items = COALESCE(NULLIF(%s, 0), Overdue_Items),
+                            Admin_ID = %s
+                        WHERE Student_ID = %s
+                        """
+                        audited_execute(connection, cursor, "Student", "UPDATE", student_id, update_query,
+                                        (name, email, phone, overdue_items, 
+                                         st.session_state['admin_id'], student_id))
+                        st.success("Student updated successfully.")
+                else:
+                    st.error("Student not found.")
+
+            elif operation == "Delete":
+                student_id = st.number_input("Enter Student ID to Delete", min_value=1)
+                
+                if st.button("Delete Student"):
+                    delete_query = "DELETE FROM Student WHERE Student_ID = %s"
+                    audited_execute(connection, cursor, "Student", "DELETE", student_id, delete_query, (student_id,))
+                    st.success("Student deleted successfully.")
+
+        # Reservations Operations
+        elif entity == "Reservation":
+            if operation == "View":
+                include_archived = st.checkbox("Include archived reservations")
+                if include_archived:
+                    cursor.execute("SELECT * FROM Reservation UNION ALL SELECT * FROM Reservation_Archive")
+                else:
+                    cursor.execute("SELECT * FROM Reservation")
+                data = cursor.fetchall()
+                df = pd.DataFrame(data, columns=[column[0] for column in cursor.description])
+                st.write(df)
+            elif operation == "Add":
+                reservation_id = st.number_input("Reservation ID", min_value=1)
+                rental_period = st.number_input("Rental Period (in days)", min_value=1)
+                return_status = st.selectbox("Return Status", ["Returned", "Pending", "In Progress"])
+                date = st.date_input("Date")
+                equipment_id = st.number_input("Equipment ID", min_value=1)
+                student_id = st.number_input("Student ID", min_value=1)
+
+                if st.button("Add Reservation"):
+                    insert_query = """
+                    INSERT INTO Reservation (Reservation_ID, Rental_Period, Return_Status, Date, Equipment_ID, Student_ID) 
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    audited_execute(connection, cursor, "Reservation", "INSERT", reservation_id, insert_query, (reservation_id, rental_period, return_status, date, equipment_id, student_id))
+                    st.success("Reservation added successfully.")
+
+            elif operation == "Update":
+                reservation_id = st.number_input("Enter Reservation ID to Update", min_value=1)
+
+                # Fetch current reservation data for the provided Reservation ID
+                cursor.execute("SELECT * FROM Reservation WHERE Reservation_ID = %s", (reservation_id,))
+                data = cursor.fetchone()
+
+                if data:
+                    rental_period = st.number_input("Rental Period (in days)", value=data[1], min_value=1)
+                    return_status = st.selectbox("Return Status", ["Returned", "Pending", "In Progress"], index=["Returned", "Pending", "In Progress"].index(data[2]))
+                    date = st.date_input("Date", value=data[3])
+                    equipment_id = st.number_input("Equipment ID", value=data[4], min_value=1)
+                    student_id = st.number_input("Student ID", value=data[5], min_value=1)
+
+                    if st.button("Update Reservation"):
+                        update_query = """
+                        UPDATE Reservation
+                        SET 
+                            Rental_Period = %s,
+                            Return_Status = %s,
+                            Date = %s,
+                            Equipment_ID = %s,
+                            Student_ID = %s
+                        WHERE Reservation_ID = %s
+                        """
+                        audited_execute(connection, cursor, "Reservation", "UPDATE", reservation_id, update_query, (rental_period, return_status, date, equipment_id, student_id, reservation_id))
+                        st.success("Reservation updated successfully.")
+                else:
+                    st.error("Reservation not found.")
+
+            elif operation == "Delete":
+                reservation_id = st.number_input("Enter Reservation ID to Delete", min_value=1)
+                
+                if st.button("Delete Reservation"):
+                    delete_query = "DELETE FROM Reservation WHERE Reservation_ID = %s"
+                    audited_execute(connection, cursor, "Reservation", "DELETE", reservation_id, delete_query, (reservation_id,))
+                    st.success("Reservation deleted successfully.")
+        # Rental Operations
+        elif entity == "Rental":
+            if operation == "View":
+                include_archived = st.checkbox("Include archived rentals")
+                if include_archived:
+                    cursor.execute("SELECT * FROM Rental UNION ALL SELECT * FROM Rental_Archive")
+                else:
+                    cursor.execute("SELECT * FROM Rental")
+                data = cursor.fetchall()
+                df = pd.DataFrame(data, columns=[column[0] for column in cursor.description])
+                st.write(df)
+
+            elif operation == "Add":
+                rental_id = st.number_input("Rental ID", min_value=1)
+                rental_date = st.date_input("Rental Date")
+                return_date = st.date_input("Return Date")
+                damage_report = st.text_area("Damage Report")
+                student_id = st.number_input("Student ID", min_value=1)
+                equipment_id = st.number_input("Equipment ID", min_value=1)
+
+                if st.button("Add Rental"):
+                    insert_query = """
+                    INSERT INTO Rental (Rental_ID, Rental_Date, Return_Date, Damage_Report, Student_ID, Equipment_ID) 
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    audited_execute(connection, cursor, "Rental", "INSERT", rental_id, insert_query, (rental_id, rental_date, return_date, damage_report, student_id, equipment_id))
+                    st.success("Rental added successfully.")
+            elif operation == "Update":
+                rental_id = st.number_input("Enter Rental ID to Update", min_value=1)
+
+                # Fetch current rental data for the provided Rental ID
+                cursor.execute("SELECT * FROM Rental WHERE Rental_ID = %s", (rental_id,))
+                data = cursor.fetchone()
+
+                if data:
+                    # Show current values and allow updates
+                    rental_date = st.date_input("Rental Date", value=data[1])
+                    return_date = st.date_input("Return Date", value=data[2] if data[2] else None)
+                    damage_report = st.text_area("Damage Report", value=data[3] if data[3] else "")
+                    student_id = st.number_input("Student ID", value=data[4], min_value=1)
+                    equipment_id = st.number_input("Equipment ID", value=data[5], min_value=1)
+
+                    if st.button("Update Rental"):
+                        update_query = """
+                        UPDATE Rental 
+                        SET 
+                            Rental_Date = %s,
+                            Return_Date = %s,
+                            Damage_Report = %s,
+                            Student_ID = %s,
+                            Equipment_ID = %s
+                        WHERE Rental_ID = %s
+                        """
+                        audited_execute(connection, cursor, "Rental", "UPDATE", rental_id, update_query, (rental_date, return_date, damage_report, student_id, equipment_id, rental_id))
+                        st.success("Rental updated successfully.")
+                else:
+                    st.error("Rental not found.")
+            elif operation == "Delete":
+                rental_id = st.number_input("Enter Rental ID to Delete", min_value=1)
+                
+                if st.button("Delete Rental"):
+                    delete_query = "DELETE FROM Rental WHERE Rental_ID = %s"
+                    audited_execute(connection, cursor, "Rental", "DELETE", rental_id, delete_query, (rental_id,))
+                    st.success("Rental deleted successfully.")
+
+        # Close the cursor and connection after operations
+        cursor.close()
+        connection.close()
+
+    # Read counters for monitoring
+    with st.sidebar.expander("Query Stats"):
+        for name, value in get_query_stats().snapshot().items():
+            st.write(f"{name.replace('_', ' ').title()}: {value}")
+
+    # Logout button
+    if st.sidebar.button("Logout"):
+        del st.session_state['user_type']
+        del st.session_state['admin_id']
+        st.rerun()
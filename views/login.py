@@ -0,0 +1,35 @@
+import streamlit as st
+from config import USER_CREDENTIALS
+
+def render_login():
+    """Centered login page"""
+    st.title("Sports Equipment Rental Management System")
+    st.subheader("Login to Access the Dashboard")
+
+    user_type_input = st.selectbox("Select User Type", ["admin_user", "student_user"])
+    password = st.text_input("Enter Password", type="password")
+
+    if st.button("Login"):
+        if user_type_input in USER_CREDENTIALS and password == USER_CREDENTIALS[user_type_input]:
+            st.session_state['user_type'] = user_type_input
+            # Shown as a toast on the next run instead of sleeping before the rerun
+            st.session_state['toast'] = f"🎉 Login successful! Welcome to the {user_type_input.replace('_', ' ').title()} Portal!"
+            st.rerun()
+        else:
+            st.error("Login Failed, Invalid Credentials")
+
+def render_admin_selection():
+    """Pick which admin is using the dashboard"""
+    # Imported here so the login page never loads the database driver
+    from db import verify_admin
+
+    st.title("Admin Selection")
+    admin_selection = st.radio("Select Admin ID", [1, 2])
+    
+    if st.button("Continue"):
+        if verify_admin(admin_selection):
+            st.session_state['admin_id'] = admin_selection
+            st.session_state['toast'] = f"Welcome Admin {admin_selection}!"
+            st.rerun()
+        else:
+            st.error("Invalid Admin ID")
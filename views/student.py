@@ -0,0 +1,285 @@
+import streamlit as st
+import pandas as pd
+from config import USER_CREDENTIALS
+from db import run_query, clear_read_cache, create_connection
+from audit import fetch_row, get_audit_logger
+from rentals import check_student_eligibility, overdue_eligibility, check_equipment_availability, make_reservation, return_equipment
+
+def highlight_equipment_status(val):
+    """Cell colour for the catalog Status column"""
+    if val == 'Available':
+        return 'background-color: #90EE90'  # Light green
+    elif val == 'In Use':
+        return 'background-color: #FFB6C1'  # Light red
+    elif val == 'Reserved':
+        return 'background-color: #FFE4B5'  # Light orange
+    elif val == 'Maintenance':
+        return 'background-color: #B0C4DE'  # Light blue
+    return ''
+
+def highlight_reservation_status(row):
+    """Row colours for the reservations table, highlighting the Status cell"""
+    if row['Status'] == 'Pending':
+        return ['background-color: #FFE4B5' if i == 4 else '' for i in range(len(row))]
+    elif row['Status'] == 'In Progress':
+        return ['background-color: #90EE90' if i == 4 else '' for i in range(len(row))]
+    elif row['Status'] == 'Returned':
+        return ['background-color: #B0C4DE' if i == 4 else '' for i in range(len(row))]
+    return ['' for i in range(len(row))]
+
+def render():
+    """Student portal with the catalog, reservations, returns and history"""
+    st.title("Welcome to the Student Portal!")
+    st.sidebar.header("Student Dashboard")
+    
+    # Get student ID
+    student_id = st.number_input("Enter Your Student ID", min_value=1001, step=1, value=1001)
+    
+    # Student Information with Alerts
+    student_rows = run_query("student_summary", (student_id,))
+    student_data = student_rows[0] if student_rows else None
+    
+    if student_data:
+        # Display student info in a clean format
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("Student Information")
+            st.write(f"Name: {student_data[1]}")
+            st.write(f"Email: {student_data[2]}")
+            st.write(f"Phone: {student_data[3]}")
+        
+        with col2:
+            st.subheader("Rental Status")
+            st.write(f"Active Rentals: {student_data[6]}")
+            st.write(f"Overdue Items: {student_data[4]}")
+            
+            if student_data[4] > 0:
+                st.error(f"⚠️ You have {student_data[4]} overdue items!")
+    
+    # Only the selected section runs its queries, unlike st.tabs which renders every tab on each rerun
+    section = st.radio("Section", ["Equipment Catalog", "Make Reservation", "Return Equipment", "My Reservations", "History"],
+                       horizontal=True, label_visibility="collapsed")
+    
+    if section == "Equipment Catalog":
+        st.subheader("Equipment Catalog")
+        # Add filters for equipment
+        col1, col2 = st.columns(2)
+        with col1:
+            # Get unique equipment types for filter
+            equipment_types = [type[0] for type in run_query("equipment_types")]
+            equipment_types.insert(0, "All")
+            selected_type = st.selectbox("Filter by Type", equipment_types)
+        
+        with col2:
+            # Filter by availability
+            availability_options = ["All", "Available", "In Use", "Reserved", "Maintenance"]
+            selected_availability = st.selectbox("Filter by Availability", availability_options)
+        
+        # "All" disables a filter so the catalog is a single fixed statement
+        equipment_data = run_query("equipment_catalog", (selected_type, selected_type,
+                                                         selected_availability, selected_availability))
+        
+        if equipment_data:
+            # Create DataFrame for better display
+            df = pd.DataFrame(equipment_data, 
+                columns=["ID", "Name", "Type", "Status", "Maintenance Status", "Next Available"])
+            
+            # Apply color coding based on status
+            styled_df = df.style.applymap(highlight_equipment_status, subset=['Status'])
+            
+            # Display the table
+            st.dataframe(styled_df, use_container_width=True)
+            
+            # Add summary statistics
+            st.subheader("Equipment Summary")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                available_count = len(df[df['Status'] == 'Available'])
+                st.metric("Available", available_count)
+            with col2:
+                in_use_count = len(df[df['Status'] == 'In Use'])
+                st.metric("In Use", in_use_count)
+            with col3:
+                reserved_count = len(df[df['Status'] == 'Reserved'])
+                st.metric("Reserved", reserved_count)
+            with col4:
+                maintenance_count = len(df[df['Status'] == 'Maintenance'])
+                st.metric("In Maintenance", maintenance_count)
+        else:
+            st.info("No equipment found matching the selected filters.")
+    
+    elif section == "Make Reservation":
+        st.subheader("Make a Reservation")
+        
+        # Check eligibility
+        overdue_rows = run_query("student_overdue_items", (student_id,))
+        eligible, msg = overdue_eligibility(overdue_rows[0][0] if overdue_rows else None)
+        if not eligible:
+            st.error(msg)
+        else:
+            # Show available equipment
+            available_equipment = run_query("available_equipment")
+            
+            if available_equipment:
+                equipment_options = {f"{eq[0]} - {eq[1]} ({eq[2]})": eq[0] for eq in available_equipment}
+                selected_equipment = st.selectbox("Select Equipment", list(equipment_options.keys()))
+                rental_period = st.number_input("Rental Period (days)", min_value=1, max_value=14, value=7)
+                
+                if st.button("Make Reservation"):
+                    # Only reservations need a write connection in this section
+                    connection = create_connection("student_user", USER_CREDENTIALS["student_user"])
+                    if connection:
+                        cursor = connection.cursor()
+                        equipment_id = equipment_options[selected_equipment]
+                        
+                        # Re-check against live data, the values shown above may come from the session cache
+                        eligible, msg = check_student_eligibility(cursor, student_id)
+                        if eligible:
+                            eligible, msg = check_equipment_availability(cursor, equipment_id)
+                        
+                        if eligible:
+                            equipment_before = fetch_row(cursor, "Equipment", "Equipment_ID", equipment_id)
+                            reservation_id = make_reservation(cursor, student_id, equipment_id, rental_period)
+                            reservation_after = fetch_row(cursor, "Reservation", "Reservation_ID", reservation_id)
+                            equipment_after = fetch_row(cursor, "Equipment", "Equipment_ID", equipment_id)
+                            st.success(f"Reservation made successfully! ID: {reservation_id}")
+                            connection.commit()
+                            clear_read_cache()
+                            
+                            audit_logger = get_audit_logger()
+                            audit_logger.log("student", student_id, "INSERT", "Reservation", reservation_id, None, reservation_after)
+                            audit_logger.log("student", student_id, "UPDATE", "Equipment", equipment_id, equipment_before, equipment_after)
+                        else:
+                            st.error(msg)
+                        cursor.close()
+                        connection.close()
+            else:
+                st.info("No equipment available for reservation at the moment.")
+    
+    elif section == "Return Equipment":
+        st.subheader("Return Equipment")
+        active_rentals = run_query("active_rentals", (student_id,))
+        
+        if active_rentals:
+            rental_options = {f"{r[0]} - {r[1]} (Due: {r[3]})": r[0] for r in active_rentals}
+            selected_rental = st.selectbox("Select Equipment to Return", list(rental_options.keys()))
+            damage_report = st.text_area("Damage Report (if any)")
+            
+            if st.button("Return Equipment"):
+                # Only returns need a write connection in this section
+                connection = create_connection("student_user", USER_CREDENTIALS["student_user"])
+                if connection:
+                    cursor = connection.cursor()
+                    rental_id = rental_options[selected_rental]
+                    rental_before = fetch_row(cursor, "Rental", "Rental_ID", rental_id)
+                    equipment_id = rental_before["Equipment_ID"] if rental_before else None
+                    equipment_before = fetch_row(cursor, "Equipment", "Equipment_ID", equipment_id)
+                    
+                    success, msg = return_equipment(cursor, rental_id, damage_report)
+                    if success:
+                        rental_after = fetch_row(cursor, "Rental", "Rental_ID", rental_id)
+                        equipment_after = fetch_row(cursor, "Equipment", "Equipment_ID", equipment_id)
+                        st.success(msg)
+                        connection.commit()
+                        clear_read_cache()
+                        
+                        audit_logger = get_audit_logger()
+                        audit_logger.log("student", student_id, "UPDATE", "Rental", rental_id, rental_before, rental_after)
+                        audit_logger.log("student", student_id, "UPDATE", "Equipment", equipment_id, equipment_before, equipment_after)
+                    else:
+                        st.error(msg)
+                    cursor.close()
+                    connection.close()
+        else:
+            st.info("No equipment to return.")
+    
+    elif section == "My Reservations":
+        st.subheader("My Reservations")
+        
+        # Fetch all reservations for the student
+        reservations = run_query("student_reservations", (student_id,))
+        
+        if reservations:
+            # Create DataFrame for reservations
+            reservations_df = pd.DataFrame(
+                reservations,
+                columns=["Reservation ID", "Equipment", "Reservation Date", 
+                        "Rental Period (Days)", "Status", "Due Date", "Equipment Status"]
+            )
+            
+            # Add color coding based on status
+            styled_df = reservations_df.style.apply(highlight_reservation_status, axis=1)
+            
+            # Show reservations with filters
+            status_filter = st.selectbox(
+                "Filter by Status",
+                ["All", "Pending", "In Progress", "Returned"]
+            )
+            
+            if status_filter != "All":
+                filtered_df = reservations_df[reservations_df['Status'] == status_filter]
+                styled_df = filtered_df.style.apply(highlight_reservation_status, axis=1)
+            
+            # Display the table
+            st.dataframe(styled_df, use_container_width=True)
+            
+            # Show summary statistics
+            st.subheader("Reservations Summary")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                pending_count = len(reservations_df[reservations_df['Status'] == 'Pending'])
+                st.metric("Pending Reservations", pending_count)
+            
+            with col2:
+                active_count = len(reservations_df[reservations_df['Status'] == 'In Progress'])
+                st.metric("Active Rentals", active_count)
+            
+            with col3:
+                completed_count = len(reservations_df[reservations_df['Status'] == 'Returned'])
+                st.metric("Completed Reservations", completed_count)
+            
+            # Show upcoming due dates
+            upcoming_due = reservations_df[
+                (reservations_df['Status'].isin(['Pending', 'In Progress'])) &
+                (reservations_df['Due Date'].notna())
+            ]
+            
+            if not upcoming_due.empty:
+                st.subheader("Upcoming Due Dates")
+                for _, row in upcoming_due.iterrows():
+                    due_date = pd.to_datetime(row['Due Date'])
+                    days_left = (due_date - pd.Timestamp.now()).days
+                    
+                    if days_left < 0:
+                        st.error(f"🚨 Overdue: {row['Equipment']} - Due date was {row['Due Date']}")
+                    elif days_left <= 2:
+                        st.warning(f"⚠️ Due Soon: {row['Equipment']} - Due on {row['Due Date']}")
+                    else:
+                        st.info(f"📅 {row['Equipment']} - Due on {row['Due Date']}")
+        
+        else:
+            st.info("No reservations found.")
+
+    elif section == "History":
+        st.subheader("Rental History")
+        include_archived = st.checkbox("Include archived history")
+        
+        if include_archived:
+            # Closed rows moved out by archive.py live in the *_Archive tables
+            history = run_query("rental_history_archived", (student_id, student_id, student_id, student_id))
+        else:
+            history = run_query("rental_history", (student_id,))
+        
+        if history:
+            history_df = pd.DataFrame(history, 
+                columns=["Rental ID", "Equipment", "Rental Date", "Return Date", 
+                        "Damage Report", "Status"])
+            st.dataframe(history_df)
+        else:
+            st.info("No rental history found.")
+    
+    # Logout button
+    if st.sidebar.button("Logout"):
+        del st.session_state['user_type']
+        st.rerun()